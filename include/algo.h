@@ -22,5 +22,8 @@ void RoughBiPartialPush(int src, double alpha, double eps, double delta, double
 // Overload that also collects V-side PPR (u->v)
 void RoughBiPartialPush(int src, double alpha, double eps, double delta, double gamma, std::vector<double>& spprU, std::vector<double>& spprV, const Graph& graph);
 
+// Batched overload: pushes srcs[b] with gammas[b] as lane b, filling spprU[b] and spprV[b]
+void RoughBiPartialPushBatch(const std::vector<int>& srcs, double alpha, double eps, double delta, const std::vector<double>& gammas, std::vector<std::vector<double>>& spprU, std::vector<std::vector<double>>& spprV, const Graph& graph);
+
 // Symmetric entry: start from a V-node, collect v->v and v->u
 void RoughBiPartialPushFromV(int srcV, double alpha, double eps, double delta, double gamma, std::vector<double>& spprV, std::vector<double>& spprU, const Graph& graph);
\ No newline at end of file
@@ -43,6 +43,7 @@ const std::string PISP = "pisp";
 const std::string ABHPP = "abhpp";
 const std::string BDPush = "BDPush";
 const std::string RBHPP = "BDPush";
+const std::string BDPushBench = "BDPushBench";
 
 struct Config{
     std::string strFolder;
@@ -56,6 +57,7 @@ struct Config{
     double gamma;
     int64 querynum;
     uint if_percentile;
+    uint batchsize;
 
 
     void display(){
@@ -68,10 +70,11 @@ struct Config{
         std::cout << "delta: " << delta << '\n';
         std::cout << "iteration: " << iteration << '\n';
         std::cout << "alpha: " << alpha << '\n';
+        std::cout << "batch size: " << batchsize << '\n';
         std::cout << "====================Configurations==================" << std::endl;
     }
     void check(){
-        std::vector<std::string> Algos = {PI,PISP,MCSP,ABHPP,RBHPP,BDPush};
+        std::vector<std::string> Algos = {PI,PISP,MCSP,ABHPP,RBHPP,BDPush,BDPushBench};
         auto f = std::find(Algos.begin(), Algos.end(), strAlgo);
         assert (f != Algos.end());
     }
@@ -80,6 +83,9 @@ struct Config{
         if(epsilon==0){
             epsilon=1.0e-6;
         }
+        if(batchsize==0){
+            batchsize=1;
+        }
         iteration = 0;
         numwalks = 0;
     }
@@ -1075,6 +1075,396 @@ void RoughBiPartialPush(int src, double alpha, double eps, double delta, double
     }
 }
 
+// Batched version of the V-side overload: pushes a block of sources together.
+// The residues of node x for lane b live at x*B+b, so each adjacency list is
+// scanned once per level for the whole block instead of once per source.
+void RoughBiPartialPushBatch(const std::vector<int>& srcs, double alpha, double eps, double delta, const std::vector<double>& gammas, std::vector<std::vector<double>>& spprU, std::vector<std::vector<double>>& spprV, const Graph& graph){
+
+    uint nu = graph.getNu();
+    uint nv = graph.getNv();
+    uint B = srcs.size();
+    if(B == 0){
+        return;
+    }
+
+    // backward variables //
+    vector<vector<double>> vecUResidueBack(2, vector<double>((size_t)nu*B, 0));
+    vector<vector<uint8>> flagUBack(2, vector<uint8>((size_t)nu*B, 0)); // per lane
+    vector<vector<int>> candidateUSetBack(2, vector<int>(nu, 0));
+    vector<vector<int>> nodeFlagUBack(2, vector<int>(nu, 0)); // any lane
+    vector<int> candidateUCountBack(2, 0);
+    vector<vector<uint>> laneUCountBack(2, vector<uint>(B, 0));
+    vector<double> vecVResidueBack((size_t)nv*B, 0);
+    vector<uint8> flagVBack((size_t)nv*B, 0);
+    vector<int> candidateVSetBack(nv, 0);
+    vector<int> nodeFlagVBack(nv, 0);
+    uint candidateVCountBack = 0;
+
+    // forward variables //
+    vector<vector<double>> vecUResidueFor(2, vector<double>((size_t)nu*B, 0));
+    vector<vector<uint8>> flagUFor(2, vector<uint8>((size_t)nu*B, 0));
+    vector<vector<int>> candidateUSetFor(2, vector<int>(nu, 0));
+    vector<vector<int>> nodeFlagUFor(2, vector<int>(nu, 0));
+    vector<int> candidateUCountFor(2, 0);
+    vector<double> vecVResidueFor((size_t)nv*B, 0);
+    vector<uint8> flagVFor((size_t)nv*B, 0);
+    vector<int> candidateVSetFor(nv, 0);
+    vector<int> nodeFlagVFor(nv, 0);
+    uint candidateVCountFor = 0;
+
+    vector<double> finalReserveU((size_t)nu*B, 0);
+    vector<double> finalReserveV((size_t)nv*B, 0);
+
+    // U_gamma and U_gamma_left only depend on the weight threshold of the source:
+    // u is safe iff m_uwsum[u] <= thre, and u needs to push iff some V neighbour
+    // of u has an unsafe neighbour, i.e. iff uMaxW2[u] > thre.
+    vector<double> vMaxW(nv, 0);
+    for(uint s=0; s<nu; s++){
+        for (const auto& p: graph.m_uedges[s]){
+            vMaxW[p.first] = max(vMaxW[p.first], graph.m_uwsum[s]);
+        }
+    }
+    vector<double> uMaxW2(nu, 0);
+    for(uint s=0; s<nv; s++){
+        for (const auto& p: graph.m_vedges[s]){
+            uMaxW2[p.first] = max(uMaxW2[p.first], vMaxW[s]);
+        }
+    }
+
+    uint tempLevel = 0;
+    uint L = (uint)ceil(log(eps/(double)nu)/log(1-alpha))+1;
+
+    vector<double> srcW(B), thre(B), theta(B);
+    vector<uint8> alive(B, 1);
+    for(uint b=0; b<B; b++){
+        uint src = srcs[b];
+        srcW[b] = graph.m_uwsum[src];
+        thre[b] = srcW[b] * gammas[b];
+        theta[b] = eps*eps*delta/L/48.0/gammas[b];
+
+        size_t idx = (size_t)src*B+b;
+        vecUResidueBack[0][idx] = 1;
+        flagUBack[0][idx] = 1;
+        laneUCountBack[0][b] = 1;
+        if(nodeFlagUBack[0][src] == 0){
+            nodeFlagUBack[0][src] = 1;
+            candidateUSetBack[0][candidateUCountBack[0]++] = src;
+        }
+
+        vecUResidueFor[0][idx] = 1;
+        flagUFor[0][idx] = 1;
+        if(nodeFlagUFor[0][src] == 0){
+            nodeFlagUFor[0][src] = 1;
+            candidateUSetFor[0][candidateUCountFor[0]++] = src;
+        }
+    }
+
+    // lanes still pushing from the current node, and their scaled residues.
+    vector<uint> laneB(B);
+    vector<double> laneR(B);
+
+    {
+    Timer tm(5, "batch bwd");
+    while(tempLevel < L){
+        uint tempLevelID=tempLevel%2;
+        uint newLevelID=(tempLevel+1)%2;
+
+        // a lane stops once its backward frontier is empty, as in the single-source loop.
+        uint nAlive = 0;
+        for(uint b=0; b<B; b++){
+            if(laneUCountBack[tempLevelID][b] == 0){
+                alive[b] = 0;
+            }
+            nAlive += alive[b];
+            laneUCountBack[tempLevelID][b] = 0;
+        }
+        if(nAlive == 0){
+            break;
+        }
+
+        // backward: push from U to V.
+        uint candidateUCntBack=candidateUCountBack[tempLevelID];
+        candidateUCountBack[tempLevelID]=0;
+        for(uint j = 0; j < candidateUCntBack; j++){
+            uint tempNode = candidateUSetBack[tempLevelID][j];
+            size_t base = (size_t)tempNode*B;
+            double uw = graph.m_uwsum[tempNode];
+            nodeFlagUBack[tempLevelID][tempNode] = 0;
+
+            uint nLane = 0;
+            for(uint b=0; b<B; b++){
+                size_t idx = base+b;
+                if(flagUBack[tempLevelID][idx] == 0){
+                    continue;
+                }
+                double tempR = vecUResidueBack[tempLevelID][idx];
+                flagUBack[tempLevelID][idx] = 0;
+                vecUResidueBack[tempLevelID][idx] = 0;
+
+                if(uw <= thre[b]){
+                    vecUResidueFor[tempLevelID][idx] = tempR * uw / srcW[b];
+                    if(uMaxW2[tempNode] > thre[b] && flagUFor[tempLevelID][idx] == 0){
+                        flagUFor[tempLevelID][idx] = 1;
+                        if(nodeFlagUFor[tempLevelID][tempNode] == 0){
+                            nodeFlagUFor[tempLevelID][tempNode] = 1;
+                            candidateUSetFor[tempLevelID][candidateUCountFor[tempLevelID]++] = tempNode;
+                        }
+                    }
+                }
+
+                finalReserveU[idx] += alpha * tempR;
+                laneB[nLane] = b;
+                laneR[nLane] = (1-alpha)*tempR;
+                nLane++;
+            }
+
+            if(graph.m_udeg[tempNode]>0 && nLane>0){
+                double ran = (double)rand()/(double)RAND_MAX;
+                for(const auto& p: graph.m_uedges[tempNode]){
+                    const uint v_j = p.first;
+                    const double w = p.second;
+                    const double vw = graph.m_vwsum[v_j];
+                    size_t vbase = (size_t)v_j*B;
+                    uint k = 0;
+                    while(k < nLane){
+                        uint b = laneB[k];
+                        size_t idx = vbase+b;
+                        double mass = laneR[k]*w/vw;
+                        if (mass > theta[b]){
+                            vecVResidueBack[idx] += mass;
+                        }else if(mass >= ran*theta[b]){
+                            vecVResidueBack[idx] += theta[b];
+                        }else{
+                            // this lane is done with the pre-ordered list.
+                            nLane--;
+                            laneB[k] = laneB[nLane];
+                            laneR[k] = laneR[nLane];
+                            continue;
+                        }
+                        if((flagVBack[idx] == 0) && (vecVResidueBack[idx] > 0)){
+                            flagVBack[idx] = 1;
+                            if(nodeFlagVBack[v_j] == 0){
+                                nodeFlagVBack[v_j] = 1;
+                                candidateVSetBack[candidateVCountBack++] = v_j;
+                            }
+                        }
+                        k++;
+                    }
+                    if(nLane == 0){
+                        break;
+                    }
+                }
+            }
+        }
+
+        // backward: push from V to U.
+        uint candidateVCntBack=candidateVCountBack;
+        candidateVCountBack = 0;
+        for(uint j = 0; j < candidateVCntBack; j++){
+            uint tempNode = candidateVSetBack[j];
+            size_t base = (size_t)tempNode*B;
+            nodeFlagVBack[tempNode] = 0;
+
+            uint nLane = 0;
+            for(uint b=0; b<B; b++){
+                size_t idx = base+b;
+                if(flagVBack[idx] == 0){
+                    continue;
+                }
+                laneB[nLane] = b;
+                laneR[nLane] = vecVResidueBack[idx];
+                nLane++;
+                flagVBack[idx] = 0;
+                vecVResidueBack[idx] = 0;
+            }
+
+            if(graph.m_vdeg[tempNode]>0 && nLane>0){
+                double ran = (double)rand()/(double)RAND_MAX;
+                for(const auto& p: graph.m_vedges[tempNode]){
+                    const uint u_j = p.first;
+                    const double w = p.second;
+                    const double uw = graph.m_uwsum[u_j];
+                    size_t ubase = (size_t)u_j*B;
+                    uint k = 0;
+                    while(k < nLane){
+                        uint b = laneB[k];
+                        size_t idx = ubase+b;
+                        double mass = laneR[k]*w/uw;
+                        if (mass > theta[b]){
+                            vecUResidueBack[newLevelID][idx] += mass;
+                        }else if(mass >= ran*theta[b]){
+                            vecUResidueBack[newLevelID][idx] += theta[b];
+                        }else{
+                            nLane--;
+                            laneB[k] = laneB[nLane];
+                            laneR[k] = laneR[nLane];
+                            continue;
+                        }
+                        if((flagUBack[newLevelID][idx] == 0) && (vecUResidueBack[newLevelID][idx] > theta[b])){
+                            flagUBack[newLevelID][idx] = 1;
+                            laneUCountBack[newLevelID][b]++;
+                            if(nodeFlagUBack[newLevelID][u_j] == 0){
+                                nodeFlagUBack[newLevelID][u_j] = 1;
+                                candidateUSetBack[newLevelID][candidateUCountBack[newLevelID]++] = u_j;
+                            }
+                        }
+                        k++;
+                    }
+                    if(nLane == 0){
+                        break;
+                    }
+                }
+            }
+        }
+
+        // forward: reuse from U to V and accumulate V-side PPR
+        uint candidateUCntFor=candidateUCountFor[tempLevelID];
+        candidateUCountFor[tempLevelID]=0;
+        for(uint j = 0; j < candidateUCntFor; j++){
+            uint tempNode = candidateUSetFor[tempLevelID][j];
+            size_t base = (size_t)tempNode*B;
+            double uw = graph.m_uwsum[tempNode];
+            nodeFlagUFor[tempLevelID][tempNode] = 0;
+
+            uint nLane = 0;
+            for(uint b=0; b<B; b++){
+                size_t idx = base+b;
+                if(flagUFor[tempLevelID][idx] == 0){
+                    continue;
+                }
+                double tempR = vecUResidueFor[tempLevelID][idx];
+                flagUFor[tempLevelID][idx] = 0;
+                vecUResidueFor[tempLevelID][idx] = 0;
+                if(alive[b] == 0){
+                    continue;
+                }
+                finalReserveU[idx] += alpha * tempR;
+                laneB[nLane] = b;
+                laneR[nLane] = (1-alpha)*tempR/uw;
+                nLane++;
+            }
+
+            if(graph.m_udeg[tempNode]>0 && nLane>0){
+                double ran = (double)rand()/(double)RAND_MAX;
+                for(const auto& p: graph.m_uedges[tempNode]){
+                    const uint v_j = p.first;
+                    const double w = p.second;
+                    size_t vbase = (size_t)v_j*B;
+                    uint k = 0;
+                    while(k < nLane){
+                        uint b = laneB[k];
+                        size_t idx = vbase+b;
+                        double mass = laneR[k]*w;
+                        if (mass > theta[b]){
+                            vecVResidueFor[idx] += mass;
+                        }else if(mass >= ran*theta[b]){
+                            vecVResidueFor[idx] += theta[b];
+                        }else{
+                            nLane--;
+                            laneB[k] = laneB[nLane];
+                            laneR[k] = laneR[nLane];
+                            continue;
+                        }
+                        if((flagVFor[idx] == 0) && (vecVResidueFor[idx] > 0)){
+                            flagVFor[idx] = 1;
+                            if(nodeFlagVFor[v_j] == 0){
+                                nodeFlagVFor[v_j] = 1;
+                                candidateVSetFor[candidateVCountFor++] = v_j;
+                            }
+                        }
+                        // accumulate V-side reserve with restart on V
+                        finalReserveV[idx] += alpha * mass;
+                        k++;
+                    }
+                    if(nLane == 0){
+                        break;
+                    }
+                }
+            }
+        }
+
+        // forward: reuse from V to U.
+        uint candidateVCntFor=candidateVCountFor;
+        candidateVCountFor = 0;
+        for(uint j = 0; j < candidateVCntFor; j++){
+            uint tempNode = candidateVSetFor[j];
+            size_t base = (size_t)tempNode*B;
+            double vw = graph.m_vwsum[tempNode];
+            nodeFlagVFor[tempNode] = 0;
+
+            uint nLane = 0;
+            for(uint b=0; b<B; b++){
+                size_t idx = base+b;
+                if(flagVFor[idx] == 0){
+                    continue;
+                }
+                laneB[nLane] = b;
+                laneR[nLane] = vecVResidueFor[idx]/vw;
+                nLane++;
+                flagVFor[idx] = 0;
+                vecVResidueFor[idx] = 0;
+            }
+
+            if(graph.m_vdeg[tempNode]>0 && nLane>0){
+                double ran = (double)rand()/(double)RAND_MAX;
+                for(const auto& p: graph.m_vedges[tempNode]){
+                    const uint u_j = p.first;
+                    const double w = p.second;
+                    const double uw = graph.m_uwsum[u_j];
+                    size_t ubase = (size_t)u_j*B;
+                    uint k = 0;
+                    while(k < nLane){
+                        uint b = laneB[k];
+                        if(uw <= thre[b]){ // safe nodes reuse the estimation, don't push.
+                            k++;
+                            continue;
+                        }
+                        size_t idx = ubase+b;
+                        double mass = laneR[k]*w;
+                        if (mass > theta[b]){
+                            vecUResidueFor[newLevelID][idx] += mass;
+                        }else if(mass >= ran*theta[b]){
+                            vecUResidueFor[newLevelID][idx] += theta[b];
+                        }else{
+                            nLane--;
+                            laneB[k] = laneB[nLane];
+                            laneR[k] = laneR[nLane];
+                            continue;
+                        }
+                        if((flagUFor[newLevelID][idx] == 0) && (vecUResidueFor[newLevelID][idx] > theta[b])){
+                            flagUFor[newLevelID][idx] = 1;
+                            if(nodeFlagUFor[newLevelID][u_j] == 0){
+                                nodeFlagUFor[newLevelID][u_j] = 1;
+                                candidateUSetFor[newLevelID][candidateUCountFor[newLevelID]++] = u_j;
+                            }
+                        }
+                        k++;
+                    }
+                    if(nLane == 0){
+                        break;
+                    }
+                }
+            }
+        }
+
+        tempLevel++;
+    }
+    }
+
+    spprU.assign(B, vector<double>(nu, 0));
+    spprV.assign(B, vector<double>(nv, 0));
+    for(uint u = 0; u < nu; u++ ){
+        for(uint b = 0; b < B; b++){
+            spprU[b][u] = finalReserveU[(size_t)u*B+b];
+        }
+    }
+    for(uint v = 0; v < nv; v++ ){
+        for(uint b = 0; b < B; b++){
+            spprV[b][v] = finalReserveV[(size_t)v*B+b];
+        }
+    }
+}
+
 // Symmetric version: start from V side, collect v->v and v->u
 void RoughBiPartialPushFromV(int srcV, double alpha, double eps, double delta, double gamma, std::vector<double>& spprV, std::vector<double>& spprU, const Graph& graph){
 
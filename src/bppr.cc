@@ -37,6 +37,7 @@ Config parseParams(int argc, char** argv){
         ("gamma,ga", po::value<double>()->default_value(1.0), "gamma")
         ("querynum,qn", po::value<int64>()->default_value(10), "querynum")
         ("if_percentile, pen", po::value<uint>()->default_value(0), "if_percentile")
+        ("batchsize,b", po::value<uint>()->default_value(1), "number of sources pushed together by BDPush")
     ;
 
     po::variables_map vm; 
@@ -73,6 +74,9 @@ Config parseParams(int argc, char** argv){
     if (vm.count("if_percentile")){
         config.if_percentile = vm["if_percentile"].as<uint>();
     }
+    if (vm.count("batchsize")){
+        config.batchsize = vm["batchsize"].as<uint>();
+    }
     return config;
 }
 
@@ -112,6 +116,18 @@ double getPercentile(uint source, const std::vector<double>& vec, double gamma)
 
 }
 
+double getAbsoluteGamma(uint u, const Graph& graph, const Config& config){
+    double gamma_abosolute = config.gamma;
+    if(config.if_percentile){
+        gamma_abosolute = getPercentile(u, graph.m_uwsum, config.gamma) / (double) graph.m_uwsum[u];
+        if(gamma_abosolute < 1){
+            cout << "weight threshed:" << gamma_abosolute << "less than 1, replace with 1." << endl;
+            gamma_abosolute = 1;
+        }
+    }
+    return gamma_abosolute;
+}
+
 // Load seeds from file if available; otherwise auto-generate from all U nodes (0..Nu-1) with deg>0
 vector<int> loadOrGenerateSeeds(const Graph& graph, string folder, string file_name, int count){
     string path = folder + "/" + file_name + "/seeds.txt";
@@ -344,54 +360,65 @@ int main(int argc, char **argv){
         cout << "start bppr with bdpush!" << endl;
         Timer tm(1, "bppr");
         cout << "Total U nodes: " << graph.getNu() << endl;
-        for(uint u=0; u<graph.getNu(); u++){
-            std::vector<double> ppr(graph.getNu(), 0);
-            double gamma_abosolute = config.gamma;
-
-            if(config.if_percentile){
-                gamma_abosolute = getPercentile(u, graph.m_uwsum, config.gamma) / (double) graph.m_uwsum[u];
-                if(gamma_abosolute < 1){
-                    cout << "weight threshed:" << gamma_abosolute << "less than 1, replace with 1." << endl;
-                    gamma_abosolute = 1;
-                }
+        for(uint start=0; start<graph.getNu(); start+=config.batchsize){
+            uint end = min(start+config.batchsize, graph.getNu());
+            vector<int> srcs;
+            vector<double> gammas;
+            for(uint u=start; u<end; u++){
+                double gamma_abosolute = getAbsoluteGamma(u, graph, config);
+                cout << "current node weight: " << graph.m_uwsum[u] << "; " << "gamma_abosolute: " << gamma_abosolute << endl;
+                srcs.push_back(u);
+                gammas.push_back(gamma_abosolute);
             }
-            cout << "current node weight: " << graph.m_uwsum[u] << "; " << "gamma_abosolute: " << gamma_abosolute << endl;
-            // collect both U-side and V-side PPR
-            std::vector<double> pprV(graph.getNv(), 0);
-            RoughBiPartialPush(u, config.alpha, config.epsilon, config.delta, gamma_abosolute, ppr, pprV, graph);
 
-            // write U-side (u->u)
-            stringstream ss;
-            ss << ss_dir.str() << u << ".txt";
-            fout.open(ss.str());
-            fout.setf(ios::fixed,ios::floatfield);
-            fout.precision(15);
-            if(!fout){
-                cout<<"Fail to open the writed file"<<endl;
-            }
-            for(uint u_i=0; u_i < graph.getNu(); u_i++){
-                if(ppr[u_i]>1e-8){
-                    fout<<u_i<<" "<<ppr[u_i]<<endl;
-                }
+            // collect both U-side and V-side PPR
+            vector<vector<double>> pprs, pprVs;
+            if(config.batchsize == 1){
+                pprs.assign(1, vector<double>(graph.getNu(), 0));
+                pprVs.assign(1, vector<double>(graph.getNv(), 0));
+                RoughBiPartialPush(srcs[0], config.alpha, config.epsilon, config.delta, gammas[0], pprs[0], pprVs[0], graph);
+            }else{
+                RoughBiPartialPushBatch(srcs, config.alpha, config.epsilon, config.delta, gammas, pprs, pprVs, graph);
             }
-            fout.close();
 
-            // write V-side (u->v)
-            stringstream sv;
-            sv << ss_dir.str() << u << "_v.txt";
-            ofstream fov;
-            fov.open(sv.str());
-            fov.setf(ios::fixed,ios::floatfield);
-            fov.precision(15);
-            if(!fov){
-                cout<<"Fail to open the writed file"<<endl;
-            }
-            for(uint v_i=0; v_i < graph.getNv(); v_i++){
-                if(pprV[v_i]>1e-8){
-                    fov<<v_i<<" "<<pprV[v_i]<<endl;
+            for(uint b=0; b<srcs.size(); b++){
+                uint u = srcs[b];
+                const std::vector<double>& ppr = pprs[b];
+                const std::vector<double>& pprV = pprVs[b];
+
+                // write U-side (u->u)
+                stringstream ss;
+                ss << ss_dir.str() << u << ".txt";
+                fout.open(ss.str());
+                fout.setf(ios::fixed,ios::floatfield);
+                fout.precision(15);
+                if(!fout){
+                    cout<<"Fail to open the writed file"<<endl;
+                }
+                for(uint u_i=0; u_i < graph.getNu(); u_i++){
+                    if(ppr[u_i]>1e-8){
+                        fout<<u_i<<" "<<ppr[u_i]<<endl;
+                    }
                 }
+                fout.close();
+
+                // write V-side (u->v)
+                stringstream sv;
+                sv << ss_dir.str() << u << "_v.txt";
+                ofstream fov;
+                fov.open(sv.str());
+                fov.setf(ios::fixed,ios::floatfield);
+                fov.precision(15);
+                if(!fov){
+                    cout<<"Fail to open the writed file"<<endl;
+                }
+                for(uint v_i=0; v_i < graph.getNv(); v_i++){
+                    if(pprV[v_i]>1e-8){
+                        fov<<v_i<<" "<<pprV[v_i]<<endl;
+                    }
+                }
+                fov.close();
             }
-            fov.close();
         }
 
         // Additionally, if user wants V-side seeds equal to all V nodes
@@ -439,6 +466,54 @@ int main(int argc, char **argv){
             fvu.close();
         }
     }
+    else if(config.strAlgo==BDPushBench){
+        // compare throughput and output of the per-source loop and the batched push on the seeds.
+        cout << "start bdpush batch benchmark!" << endl;
+        Timer tm(1, "bppr");
+        vector<double> gammas;
+        for(const auto& u: seeds){
+            gammas.push_back(getAbsoluteGamma(u, graph, config));
+        }
+
+        vector<vector<double>> singleU(seeds.size()), singleV(seeds.size());
+        {
+            Timer tm(6, "single-source push");
+            for(uint i=0; i<seeds.size(); i++){
+                singleU[i].assign(graph.getNu(), 0);
+                singleV[i].assign(graph.getNv(), 0);
+                RoughBiPartialPush(seeds[i], config.alpha, config.epsilon, config.delta, gammas[i], singleU[i], singleV[i], graph);
+            }
+        }
+
+        vector<vector<double>> batchU, batchV;
+        {
+            Timer tm(7, "batched push");
+            for(uint start=0; start<seeds.size(); start+=config.batchsize){
+                uint end = min(start+config.batchsize, (uint)seeds.size());
+                vector<int> srcs(seeds.begin()+start, seeds.begin()+end);
+                vector<double> batchGammas(gammas.begin()+start, gammas.begin()+end);
+                vector<vector<double>> pprs, pprVs;
+                RoughBiPartialPushBatch(srcs, config.alpha, config.epsilon, config.delta, batchGammas, pprs, pprVs, graph);
+                batchU.insert(batchU.end(), pprs.begin(), pprs.end());
+                batchV.insert(batchV.end(), pprVs.begin(), pprVs.end());
+            }
+        }
+
+        double maxErrU = 0, maxErrV = 0;
+        for(uint i=0; i<seeds.size(); i++){
+            for(uint u_i=0; u_i < graph.getNu(); u_i++){
+                maxErrU = max(maxErrU, fabs(batchU[i][u_i] - singleU[i][u_i]));
+            }
+            for(uint v_i=0; v_i < graph.getNv(); v_i++){
+                maxErrV = max(maxErrV, fabs(batchV[i][v_i] - singleV[i][v_i]));
+            }
+        }
+
+        cout << "sources: " << seeds.size() << ", batch size: " << config.batchsize << endl;
+        cout << "single-source: " << seeds.size() / Timer::used(6) << " sources per second" << endl;
+        cout << "batched: " << seeds.size() / Timer::used(7) << " sources per second" << endl;
+        cout << "max abs difference U-side: " << maxErrU << ", V-side: " << maxErrV << endl;
+    }
     
     cout << Timer::used(1)*1000/query_count << " milli-seconds per query" << endl;
     Timer::show();